@@ -1,15 +1,28 @@
 # pylint: disable=anomalous-backslash-in-string
 import json
-from collections import defaultdict
+from array import array
+from collections import defaultdict, deque
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, Mapping, Optional, Set, Tuple, cast
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
 
 import pendulum
-import toposort
 
 import dagster._check as check
 from dagster._annotations import experimental
-from dagster._core.definitions.asset_selection import AssetSelection
+from dagster._core.definitions.asset_selection import AssetSelection, Resolver
 from dagster._core.storage.pipeline_run import IN_PROGRESS_RUN_STATUSES, RunsFilter
 from dagster._utils import utc_datetime_from_timestamp
 
@@ -21,10 +34,167 @@
 from .utils import check_valid_name
 
 if TYPE_CHECKING:
-    from dagster._core.definitions import AssetsDefinition, SourceAsset
+    from dagster._core.definitions import AssetsDefinition, RepositoryDefinition, SourceAsset
+    from dagster._core.instance import DagsterInstance
     from dagster._core.storage.event_log.base import EventLogRecord
 
 
+def _is_cursor_at_or_after(cursor_tuple: Tuple[float, int], other: Tuple[float, int]) -> bool:
+    # a (timestamp, storage id) cursor only selects a subset of the events selected by another
+    # cursor if neither its timestamp nor its storage id is earlier
+    return cursor_tuple[0] >= other[0] and cursor_tuple[1] >= other[1]
+
+
+class CachingInstanceQueryer:
+    """Queries the instance for the materializations, planned materializations and run statuses
+    needed to evaluate the sensor, caching the results so that each is fetched at most once per
+    sensor tick.
+    """
+
+    def __init__(self, instance: "DagsterInstance"):
+        self._instance = instance
+
+        # for each asset, the earliest (timestamp, storage id) cursor that we know there are no
+        # materializations after
+        self._no_materializations_after_cursor_cache: Dict[AssetKey, Tuple[float, int]] = {}
+        # for each asset, the latest materialization record we have fetched. As it is the latest,
+        # it is the result of the query for any cursor that it is after
+        self._latest_materialization_record_cache: Dict[AssetKey, "EventLogRecord"] = {}
+        self._latest_planned_materialization_cache: Dict[AssetKey, Optional["EventLogRecord"]] = {}
+        self._is_run_in_progress_cache: Dict[str, bool] = {}
+        self._run_planned_materializations_cache: Dict[str, AbstractSet[AssetKey]] = {}
+
+    def prefetch_latest_materializations(self, asset_keys: AbstractSet[AssetKey]) -> None:
+        """Fetches the latest materialization of each of the given assets with a single query."""
+        latest_materializations = self._instance.get_latest_materialization_events(list(asset_keys))
+        for asset_key in asset_keys:
+            if latest_materializations.get(asset_key) is None:
+                # the asset has never been materialized, so there are no materializations after
+                # any cursor
+                self._no_materializations_after_cursor_cache[asset_key] = (0.0, 0)
+
+    def get_latest_materialization_record(
+        self, asset_key: AssetKey, cursor_tuple: Tuple[float, int]
+    ) -> Optional["EventLogRecord"]:
+        """Returns the latest materialization record for the asset that is newer than the given
+        (timestamp, storage id) cursor.
+        """
+        from dagster._core.event_api import RunShardedEventsCursor
+        from dagster._core.events import DagsterEventType
+        from dagster._core.storage.event_log.base import EventRecordsFilter
+
+        no_materializations_after_cursor = self._no_materializations_after_cursor_cache.get(
+            asset_key
+        )
+        if no_materializations_after_cursor is not None and _is_cursor_at_or_after(
+            cursor_tuple, no_materializations_after_cursor
+        ):
+            return None
+
+        latest_materialization_record = self._latest_materialization_record_cache.get(asset_key)
+        if (
+            latest_materialization_record is not None
+            and latest_materialization_record.event_log_entry.timestamp > cursor_tuple[0]
+            and latest_materialization_record.storage_id > cursor_tuple[1]
+        ):
+            return latest_materialization_record
+
+        event_records = self._instance.get_event_records(
+            EventRecordsFilter(
+                event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                asset_key=asset_key,
+                after_cursor=RunShardedEventsCursor(
+                    run_updated_after=cast(
+                        datetime,
+                        pendulum.parse(utc_datetime_from_timestamp(cursor_tuple[0]).isoformat()),
+                    ),
+                    id=cursor_tuple[1],
+                ),
+            ),
+            ascending=False,
+            limit=1,
+        )
+        event_record = next(iter(event_records), None)
+
+        if event_record is not None:
+            self._latest_materialization_record_cache[asset_key] = event_record
+
+        # if there are no materializations after this cursor, there are none after any later
+        # cursor either, so keep track of the earliest cursor we know this for
+        if event_record is None and (
+            no_materializations_after_cursor is None
+            or _is_cursor_at_or_after(no_materializations_after_cursor, cursor_tuple)
+        ):
+            self._no_materializations_after_cursor_cache[asset_key] = cursor_tuple
+
+        return event_record
+
+    def get_latest_planned_materialization_record(
+        self, asset_key: AssetKey
+    ) -> Optional["EventLogRecord"]:
+        from dagster._core.events import DagsterEventType
+        from dagster._core.storage.event_log.base import EventRecordsFilter
+
+        if asset_key not in self._latest_planned_materialization_cache:
+            event_records = self._instance.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+                    asset_key=asset_key,
+                ),
+                ascending=False,
+                limit=1,
+            )
+            self._latest_planned_materialization_cache[asset_key] = next(iter(event_records), None)
+
+        return self._latest_planned_materialization_cache[asset_key]
+
+    def run_planned_to_materialize_asset(self, run_id: str, asset_key: AssetKey) -> bool:
+        """Returns True if the given run planned to materialize the given asset."""
+        from dagster._core.events import DagsterEventType
+
+        # parents are often materialized by the same run, so the planned materializations are
+        # fetched once per run_id rather than once per parent
+        if run_id not in self._run_planned_materializations_cache:
+            planned_materialization_records = self._instance.get_records_for_run(
+                run_id=run_id,
+                of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+            ).records
+            self._run_planned_materializations_cache[run_id] = {
+                record.event_log_entry.dagster_event.event_specific_data.asset_key
+                for record in planned_materialization_records
+            }
+
+        return asset_key in self._run_planned_materializations_cache[run_id]
+
+    def prefetch_in_progress_runs(self, run_ids: AbstractSet[str]) -> None:
+        """Fetches the status of all of the given runs with a single runs query."""
+        run_ids_to_fetch = [
+            run_id for run_id in run_ids if run_id not in self._is_run_in_progress_cache
+        ]
+        if not run_ids_to_fetch:
+            return
+
+        in_progress_run_ids = {
+            run.run_id
+            for run in self._instance.get_runs(
+                filters=RunsFilter(run_ids=run_ids_to_fetch, statuses=IN_PROGRESS_RUN_STATUSES)
+            )
+        }
+        for run_id in run_ids_to_fetch:
+            self._is_run_in_progress_cache[run_id] = run_id in in_progress_run_ids
+
+    def is_run_in_progress(self, run_id: str) -> bool:
+        # many parents are often planned by the same run, so the status is cached per run_id
+        if run_id not in self._is_run_in_progress_cache:
+            self._is_run_in_progress_cache[run_id] = bool(
+                self._instance.get_runs(
+                    filters=RunsFilter(run_ids=[run_id], statuses=IN_PROGRESS_RUN_STATUSES)
+                )
+            )
+
+        return self._is_run_in_progress_cache[run_id]
+
+
 def _get_upstream_mapping(
     selection,
     assets,
@@ -32,42 +202,142 @@ def _get_upstream_mapping(
 ) -> Mapping[AssetKey, Set[AssetKey]]:
     """Computes a mapping of assets in self._selection to their parents in the asset graph"""
     upstream = defaultdict(set)
-    selection_resolved = list(selection.resolve([*assets, *source_assets]))
-    for a in selection_resolved:
-        a_parents = list(
-            AssetSelection.keys(a).upstream(depth=1).resolve([*assets, *source_assets])
-        )
-        # filter out a because upstream() includes the assets in the original AssetSelection
-        upstream[a] = {p for p in a_parents if p != a}
+    # resolve the selection and build the dependency graph once, rather than re-resolving a
+    # depth-1 upstream selection for every selected asset
+    resolver = Resolver([*assets, *source_assets])
+    upstream_names_by_name = resolver.asset_dep_graph["upstream"]
+    for a in resolver.resolve(selection):
+        upstream[a] = {
+            AssetKey.from_user_string(p)
+            for p in upstream_names_by_name.get(a.to_user_string(), set())
+        }
     return upstream
 
 
+def _serialize_cursor_dict(cursor_dict: Mapping[str, Tuple[float, int]]) -> str:
+    # the cursor must remain a JSON object keyed by asset key str, since it is also unpacked by the
+    # MultiAssetSensorEvaluationContext. Skip the whitespace between items to keep it compact
+    return json.dumps(cursor_dict, separators=(",", ":"))
+
+
+def _deserialize_cursor_dict(cursor: Optional[str]) -> Dict[str, Tuple[float, int]]:
+    if not cursor:
+        return {}
+    return {
+        key_str: (timestamp, storage_id)
+        for key_str, (timestamp, storage_id) in json.loads(cursor).items()
+    }
+
+
+def _toposort_assets(upstream: Mapping[AssetKey, Set[AssetKey]]) -> Sequence[AssetKey]:
+    """Sorts the keys of upstream topologically using Kahn's algorithm. Parents that are not keys of
+    upstream (i.e. assets we are not monitoring) are ignored, so only monitored assets are returned.
+    """
+    children: Dict[AssetKey, List[AssetKey]] = defaultdict(list)
+    num_unsorted_parents: Dict[AssetKey, int] = {}
+    for asset_key, parents in upstream.items():
+        monitored_parents = [p for p in parents if p in upstream]
+        num_unsorted_parents[asset_key] = len(monitored_parents)
+        for p in monitored_parents:
+            children[p].append(asset_key)
+
+    to_visit = deque(
+        asset_key for asset_key, num_parents in num_unsorted_parents.items() if num_parents == 0
+    )
+    toposort_assets: List[AssetKey] = []
+    while to_visit:
+        asset_key = to_visit.popleft()
+        toposort_assets.append(asset_key)
+        for child in children[asset_key]:
+            num_unsorted_parents[child] -= 1
+            if num_unsorted_parents[child] == 0:
+                to_visit.append(child)
+
+    check.invariant(
+        len(toposort_assets) == len(upstream), "Circular dependency found in the asset graph"
+    )
+    return toposort_assets
+
+
+class _AssetGraph(NamedTuple):
+    """The portion of the asset graph monitored by the sensor, with asset keys interned to integer
+    ids so that the per-tick loop works with ints rather than hashing AssetKeys. The monitored
+    assets are assigned ids 0..num_monitored-1 in topological order, and the parents that are not
+    monitored are assigned the ids after them.
+    """
+
+    # indexed by asset id
+    asset_keys: Sequence[AssetKey]
+    asset_key_strs: Sequence[str]
+    num_monitored: int
+    # the parents of each monitored asset, in compressed sparse row form: the ids of the parents of
+    # asset i are parent_indices[parent_indptr[i] : parent_indptr[i + 1]]
+    parent_indptr: "array[int]"
+    parent_indices: "array[int]"
+    parent_asset_keys: AbstractSet[AssetKey]
+
+    def get_parent_ids(self, asset_id: int) -> Sequence[int]:
+        return self.parent_indices[self.parent_indptr[asset_id] : self.parent_indptr[asset_id + 1]]
+
+
+def _intern_asset_graph(
+    upstream: Mapping[AssetKey, Set[AssetKey]], toposort_assets: Sequence[AssetKey]
+) -> _AssetGraph:
+    id_by_asset_key = {asset_key: asset_id for asset_id, asset_key in enumerate(toposort_assets)}
+    asset_keys = list(toposort_assets)
+    parent_indptr = array("i", [0])
+    parent_indices = array("i")
+    for asset_key in toposort_assets:
+        for p in upstream[asset_key]:
+            if p not in id_by_asset_key:
+                id_by_asset_key[p] = len(asset_keys)
+                asset_keys.append(p)
+            parent_indices.append(id_by_asset_key[p])
+        parent_indptr.append(len(parent_indices))
+
+    return _AssetGraph(
+        asset_keys=asset_keys,
+        asset_key_strs=[str(asset_key) for asset_key in asset_keys],
+        num_monitored=len(toposort_assets),
+        parent_indptr=parent_indptr,
+        parent_indices=parent_indices,
+        parent_asset_keys=set().union(*upstream.values()),
+    )
+
+
 def _get_parent_updates(
-    context,
     current_asset: AssetKey,
-    parent_assets: Set[AssetKey],
+    parent_ids: Sequence[int],
+    asset_keys: Sequence[AssetKey],
     cursor_tuple: Tuple[float, int],
-    will_materialize_set: Set[AssetKey],
+    will_materialize: bytearray,
+    wait_for_all_upstream: bool,
     wait_for_in_progress_runs: bool,
-    planned_materialization_cache: Dict[AssetKey, "EventLogRecord"],
-) -> Tuple[Mapping[AssetKey, Tuple[bool, Tuple[float, int]]], Dict[AssetKey, "EventLogRecord"],]:
+    instance_queryer: "CachingInstanceQueryer",
+) -> Tuple[bool, List[Tuple[float, int]]]:
     """The bulk of the logic in the sensor is in this function. At the end of the function we return a
-    dictionary that maps each asset to a Tuple. The Tuple contains a boolean, indicating if the asset
-    has materialized or will materialize, and a tuple(float, int) representing the timestamp and storage id
-    the parent asset would update the cursor to if it is the most recent materialization of a parent asset.
-    In some cases we set the tuple to (0.0, 0) so that the tuples of other parent materializations will take precedent.
+    boolean indicating if current_asset should be materialized, along with a list parallel to
+    parent_ids containing a tuple(float, int) for each parent asset, representing the timestamp and
+    storage id the parent asset would update the cursor to if it is the most recent materialization
+    of a parent asset. In some cases we set the tuple to (0.0, 0) so that the tuples of other parent
+    materializations will take precedent.
 
     Args:
         current_asset: We want to determine if this asset should materialize, so we gather information about
             if its parents have materialized.
-        parent_assets: the parents of current_asset.
+        parent_ids: the ids of the parents of current_asset.
+        asset_keys: the asset keys of the asset graph, indexed by id.
         cursor_tuple: In the cursor for the sensor we store the timestamp and storage id of the most recent materialization
             of current_asset's parents. This allows us to see if any of the parents have been materialized
             more recently.
-        will_materialize_set: A set of all of the assets the sensor has already determined it will materialize.
-            We check if the parent assets are in this list when determining their materialization status
+        will_materialize: Flags, indexed by asset id, for all of the assets the sensor has already determined
+            it will materialize. We check the flags of the parent assets when determining their materialization status
+        wait_for_all_upstream: If current_asset should only be materialized if all of its parents have
+            been updated, rather than any of them.
         wait_for_in_progress_runs: If the user wants the sensor to wait for in progress runs of parent
             assets to complete before materializing current_asset.
+        instance_queryer: Caches the materializations, planned materializations and run statuses
+            queried from the instance over the course of the sensor tick.
 
     Here's how we get there:
 
@@ -79,129 +349,151 @@ def _get_parent_updates(
     We iterate through each parent of the asset and determine its materialization info. The parent
     asset's materialization status can be one of three options:
     1. The parent has materialized since the last time the child was materialized.
-    2. The parent is slated to be materialized (i.e. included in will_materialize_set)
+    2. The parent is slated to be materialized (i.e. flagged in will_materialize)
     3. The parent has not been materialized and will not be materialized by the sensor.
 
-    In cases 1 and 2 we indicate that the parent has been updated by setting its value in
-    parent_asset_event_records to True. For case 3 we set its value to False.
+    In cases 1 and 2 we consider the parent updated. In case 3 we do not.
 
     If wait_for_in_progress_runs=True, there is another condition we want to check for.
     If any of the parents is currently being materialized we want to wait to materialize current_asset
     until the parent materialization is complete so that the asset can have the most up to date data.
     So, for each parent asset we check if it has a planned asset materialization event in a run that
-    is currently in progress. If this is the case, we don't want current_asset to materialize, so we
-    set parent_asset_event_records to False for all parents (so that if the sensor is set to
-    materialize if any of the parents are updated, the sensor will still choose to not materialize
-    the asset) and immediately return.
+    is currently in progress. If this is the case, we don't want current_asset to materialize, even
+    if the sensor is set to materialize if any of the parents are updated, so we immediately return
+    that current_asset should not be materialized.
+
+    Once the result is known, the remaining parents are only checked as far as they can still
+    affect it. With wait_for_all_upstream=True we return as soon as a parent has not been updated,
+    and otherwise, once a parent has been updated we only fetch the cursors of the remaining
+    parents.
     """
-    from dagster._core.event_api import RunShardedEventsCursor
-    from dagster._core.events import DagsterEventType
-    from dagster._core.storage.event_log.base import EventRecordsFilter
-
-    parent_asset_event_records: Dict[AssetKey, Tuple[bool, Tuple[float, int]]] = {}
-
-    for p in parent_assets:
-        if p in will_materialize_set:
+    num_parents = len(parent_ids)
+    # the parent cursors are stored in a list indexed by the position of the parent in parent_ids,
+    # rather than a dict of tuples, to avoid allocating an entry per parent
+    parent_cursors: List[Tuple[float, int]] = [(0.0, 0)] * num_parents
+    # fold the materialization statuses of the parents as we go, rather than keeping a flag per
+    # parent and making a second pass over them
+    should_materialize = wait_for_all_upstream
+
+    for i, p_id in enumerate(parent_ids):
+        if will_materialize[p_id]:
             # if p will be materialized by this sensor, then we can also materialize current_asset
             # we don't know what time asset p will be materialized so we set the cursor val to (0.0, 0)
-            parent_asset_event_records[p] = (
-                True,
-                (0.0, 0),
-            )
+            p_updated, p_cursor = True, (0.0, 0)
         # TODO - when source asset versioning lands, add a check here that will see if the version has
         # updated if p is a source asset
         else:
+            p = asset_keys[p_id]
             if wait_for_in_progress_runs:
                 # if p is currently being materialized, then we don't want to materialize current_asset
 
-                # get the most recent planned materialization
-                if p in planned_materialization_cache.keys():
-                    # put it in a list so the indexing later works
-                    materialization_planned_event_records = [planned_materialization_cache[p]]
-                else:
-                    materialization_planned_event_records = context.instance.get_event_records(
-                        EventRecordsFilter(
-                            event_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
-                            asset_key=p,
-                        ),
-                        ascending=False,
-                        limit=1,
-                    )
+                # get the most recent planned materialization, and see if it is part of an in
+                # progress run
+                planned_materialization_record = (
+                    instance_queryer.get_latest_planned_materialization_record(p)
+                )
+                if planned_materialization_record and instance_queryer.is_run_in_progress(
+                    planned_materialization_record.event_log_entry.run_id
+                ):
+                    # we don't want to materialize current_asset because p is
+                    # being materialized. We'll materialize the asset on the next tick when the
+                    # materialization of p is complete
+                    return False, [(0.0, 0)] * num_parents
 
-                if materialization_planned_event_records:
-                    # add it to the cache
-                    planned_materialization_cache[p] = materialization_planned_event_records[0]
-                    # see if the most recent planned materialization is part of an in progress run
-                    in_progress = context.instance.get_runs(
-                        filters=RunsFilter(
-                            run_ids=[
-                                materialization_planned_event_records[0].event_log_entry.run_id
-                            ],
-                            statuses=IN_PROGRESS_RUN_STATUSES,
-                        )
-                    )
-                    if in_progress:
-                        # we don't want to materialize current_asset because p is
-                        # being materialized. We'll materialize the asset on the next tick when the
-                        # materialization of p is complete
-                        parent_asset_event_records = {pp: (False, (0.0, 0)) for pp in parent_assets}
-
-                        return (
-                            parent_asset_event_records,
-                            planned_materialization_cache,
-                        )
             # check if there is a completed materialization for p
 
-            event_records = context.instance.get_event_records(
-                EventRecordsFilter(
-                    event_type=DagsterEventType.ASSET_MATERIALIZATION,
-                    asset_key=p,
-                    after_cursor=RunShardedEventsCursor(
-                        run_updated_after=cast(
-                            datetime,
-                            pendulum.parse(
-                                utc_datetime_from_timestamp(cursor_tuple[0]).isoformat()
-                            ),
-                        ),
-                        id=cursor_tuple[1],
-                    ),
-                ),
-                ascending=False,
-                limit=1,
-            )
+            event_record = instance_queryer.get_latest_materialization_record(p, cursor_tuple)
 
-            if event_records:
-                # if the run for the materialization of p also materialized current_asset, we
-                # don't consider p "updated" when determining if current_asset should materialize
-                other_materialized_asset_records = context.instance.get_records_for_run(
-                    run_id=event_records[0].event_log_entry.run_id,
-                    of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
-                ).records
-                other_materialized_assets = [
-                    event.event_log_entry.dagster_event.event_specific_data.asset_key
-                    for event in other_materialized_asset_records
-                ]
-                if current_asset in other_materialized_assets:
-                    # we still update the cursor for p so this materialization isn't considered
-                    # on the next sensor tick
-                    parent_asset_event_records[p] = (
-                        False,
-                        (event_records[0].event_log_entry.timestamp, event_records[0].storage_id),
-                    )
+            if event_record:
+                if should_materialize and not wait_for_all_upstream:
+                    # another parent has already been updated, so whether p counts as updated
+                    # doesn't change the result. We only need the cursor for p, and can skip
+                    # fetching the planned materializations of its run
+                    p_updated = True
                 else:
-                    # current_asset was not updated along with p, so we consider p updated
-                    parent_asset_event_records[p] = (
-                        True,
-                        (event_records[0].event_log_entry.timestamp, event_records[0].storage_id),
+                    # if the run for the materialization of p also materialized current_asset, we
+                    # don't consider p "updated" when determining if current_asset should
+                    # materialize. In that case we still update the cursor for p so this
+                    # materialization isn't considered on the next sensor tick
+                    p_updated = not instance_queryer.run_planned_to_materialize_asset(
+                        event_record.event_log_entry.run_id, current_asset
                     )
+                p_cursor = (event_record.event_log_entry.timestamp, event_record.storage_id)
             else:
                 # p has not been materialized and will not be materialized by the sensor
-                parent_asset_event_records[p] = (False, (0.0, 0))
+                p_updated, p_cursor = False, (0.0, 0)
+
+        parent_cursors[i] = p_cursor
+        if wait_for_all_upstream:
+            should_materialize = should_materialize and p_updated
+            if not should_materialize:
+                # current_asset won't be materialized whatever the status of the remaining parents,
+                # and the cursors are only used if it is, so stop querying for them
+                break
+        else:
+            should_materialize = should_materialize or p_updated
 
-    return (
-        parent_asset_event_records,
-        planned_materialization_cache,
-    )
+    return should_materialize, parent_cursors
+
+
+def _get_consumed_cursor(
+    cursor_tuple: Tuple[float, int],
+    parent_cursors: Iterable[Tuple[float, int]],
+    cursor_compare_idx: int,
+) -> Tuple[float, int]:
+    """Select the cursor an asset has consumed up to once it is materialized: the max of the
+    cursors of its parents' materializations and its existing cursor.
+
+    If we're using a sharded event log storage, compare timestamps, otherwise compare storage ids.
+    See cursor_compare_idx for how this is determined. The max is taken in a single pass so that we
+    don't build a list of the candidates. Ties are resolved in favor of the earliest candidate.
+    """
+    max_cursor = None
+    for cursor_val in parent_cursors:
+        if max_cursor is None or cursor_val[cursor_compare_idx] > max_cursor[cursor_compare_idx]:
+            max_cursor = cursor_val
+    if max_cursor is None or cursor_tuple[cursor_compare_idx] > max_cursor[cursor_compare_idx]:
+        max_cursor = cursor_tuple
+    return max_cursor
+
+
+def _chunk_asset_ids(
+    asset_ids: Sequence[int], graph: _AssetGraph, max_assets_per_run: int
+) -> List[List[int]]:
+    """Split the ids of the assets to materialize, which are in topological order, into groups of at
+    most max_assets_per_run assets that can be launched as separate runs.
+
+    An asset must be materialized in the same run as any of its parents that are also being
+    materialized, so the assets are first grouped into the connected components of the selected
+    portion of the asset graph. Components are then packed into chunks in topological order. A
+    component with more than max_assets_per_run assets is kept whole in its own chunk.
+    """
+    # union-find over the selected assets, joining each asset to its selected parents
+    component_root = {a_id: a_id for a_id in asset_ids}
+
+    def _find(a_id: int) -> int:
+        while component_root[a_id] != a_id:
+            component_root[a_id] = component_root[component_root[a_id]]
+            a_id = component_root[a_id]
+        return a_id
+
+    for a_id in asset_ids:
+        for p_id in graph.get_parent_ids(a_id):
+            if p_id in component_root:
+                component_root[_find(p_id)] = _find(a_id)
+
+    # assets within a component stay in topological order
+    components: Dict[int, List[int]] = {}
+    for a_id in asset_ids:
+        components.setdefault(_find(a_id), []).append(a_id)
+
+    chunks: List[List[int]] = []
+    for component in components.values():
+        if chunks and len(chunks[-1]) + len(component) <= max_assets_per_run:
+            chunks[-1].extend(component)
+        else:
+            chunks.append(list(component))
+    return chunks
 
 
 def _make_sensor(
@@ -213,6 +505,7 @@ def _make_sensor(
     description: Optional[str],
     default_status: DefaultSensorStatus,
     run_tags: Optional[Mapping[str, str]],
+    max_assets_per_run: Optional[int] = None,
 ) -> MultiAssetSensorDefinition:
     """Creates the sensor that will monitor the parents of all provided assets and determine
     which assets should be materialized (ie their parents have been updated).
@@ -227,32 +520,64 @@ def _make_sensor(
     We keep track of timestamp and storage id so that we can support sharded event log storages (SqliteEventLogStorage).
     """
 
-    def sensor_fn(context):
-        asset_defs_by_key = (
-            context._repository_def._assets_defs_by_key  # pylint: disable=protected-access
-        )
-        source_asset_defs_by_key = (
-            context._repository_def.source_assets_by_key  # pylint: disable=protected-access
-        )
-        upstream: Mapping[AssetKey, Set[AssetKey]] = _get_upstream_mapping(
-            selection=selection,
-            assets=asset_defs_by_key.values(),
-            source_assets=source_asset_defs_by_key.values(),
-        )
+    # the asset graph does not change for a given repository definition, so we compute the upstream
+    # mapping and topological order once and reuse them across sensor ticks. The cached repository
+    # definition is kept alongside the graph so that its id cannot be reused by another object
+    graph_cache: Dict[int, Tuple["RepositoryDefinition", _AssetGraph]] = {}
 
-        cursor_dict: Dict[str, int] = json.loads(context.cursor) if context.cursor else {}
-        should_materialize: Set[AssetKey] = set()
-        cursor_update_dict: Dict[str, int] = {}
-        # keep track of the in planned materializations for each parent so we don't repeat
-        # calls to the db
-        planned_materialization_cache: Dict[AssetKey, "EventLogRecord"] = {}
-
-        # sort the assets topologically so that we process them in order
-        toposort_assets = list(toposort.toposort(upstream))
-        # unpack the list of sets into a list and only keep the ones we are monitoring
-        toposort_assets = [
-            asset for layer in toposort_assets for asset in layer if asset in upstream.keys()
-        ]
+    def _get_graph(repository_def: "RepositoryDefinition") -> _AssetGraph:
+        if id(repository_def) not in graph_cache:
+            asset_defs_by_key = (
+                repository_def._assets_defs_by_key  # pylint: disable=protected-access
+            )
+            upstream = _get_upstream_mapping(
+                selection=selection,
+                assets=asset_defs_by_key.values(),
+                source_assets=repository_def.source_assets_by_key.values(),
+            )
+            # sort the assets topologically so that we process them in order
+            toposort_assets = _toposort_assets(upstream)
+            # only hold on to the most recently loaded repository definition
+            graph_cache.clear()
+            graph_cache[id(repository_def)] = (
+                repository_def,
+                _intern_asset_graph(upstream, toposort_assets),
+            )
+
+        return graph_cache[id(repository_def)][1]
+
+    def sensor_fn(context):
+        graph = _get_graph(context._repository_def)  # pylint: disable=protected-access
+
+        cursor_dict = _deserialize_cursor_dict(context.cursor)
+        # the ids of the assets that will be materialized on this tick, in topological order, along
+        # with a flag per asset id so that checking if a parent will be materialized is an index
+        should_materialize: List[int] = []
+        will_materialize = bytearray(len(graph.asset_keys))
+        # cursor values for the assets that will be materialized on this tick. The full cursor is
+        # only assembled and serialized if there is something to materialize
+        newly_consumed_cursors: Dict[str, Tuple[float, int]] = {}
+        # keep track of the materializations, planned materializations and in progress runs we
+        # have queried for so we don't repeat calls to the db
+        instance_queryer = CachingInstanceQueryer(context.instance)
+        # fetch the latest materialization of every parent in one query, so that we can skip the
+        # per-asset queries for parents that have never been materialized
+        instance_queryer.prefetch_latest_materializations(graph.parent_asset_keys)
+
+        if wait_for_in_progress_runs:
+            # check the status of every run that is planning to materialize a parent with a single
+            # query, rather than once per run as we encounter them
+            planned_materialization_records = [
+                instance_queryer.get_latest_planned_materialization_record(p)
+                for p in graph.parent_asset_keys
+            ]
+            instance_queryer.prefetch_in_progress_runs(
+                {
+                    record.event_log_entry.run_id
+                    for record in planned_materialization_records
+                    if record is not None
+                }
+            )
 
         # if the event storage is sharded we want to compare timestamps, otherwise we compare
         # storage ids. In the cursor, timestamp is index 0 and storage_id is 1
@@ -260,42 +585,59 @@ def sensor_fn(context):
 
         # determine which assets should materialize based on the materialization status of their
         # parents
-        for a in toposort_assets:
-            a_cursor = cursor_dict.get(str(a), (0.0, 0))
-            cursor_update_dict[str(a)] = a_cursor
-            (parent_update_records, planned_materialization_cache,) = _get_parent_updates(
-                context,
-                current_asset=a,
-                parent_assets=upstream[a],
+        for a_id in range(graph.num_monitored):
+            a_key_str = graph.asset_key_strs[a_id]
+            a_cursor = cursor_dict.get(a_key_str, (0.0, 0))
+            a_should_materialize, parent_cursors = _get_parent_updates(
+                current_asset=graph.asset_keys[a_id],
+                parent_ids=graph.get_parent_ids(a_id),
+                asset_keys=graph.asset_keys,
                 cursor_tuple=a_cursor,
-                will_materialize_set=should_materialize,
+                will_materialize=will_materialize,
+                wait_for_all_upstream=wait_for_all_upstream,
                 wait_for_in_progress_runs=wait_for_in_progress_runs,
-                planned_materialization_cache=planned_materialization_cache,
+                instance_queryer=instance_queryer,
             )
 
-            condition = all if wait_for_all_upstream else any
-            if condition(
-                [
-                    materialization_status
-                    for materialization_status, _ in parent_update_records.values()
-                ]
-            ):
-                should_materialize.add(a)
-
-                # get the cursor value by selecting the max of all the cadidates. If we're using a
-                # sharded event log storage, compare timestamps, otherwise compare storage ids. See
-                # cursor_compare_idx for how this is determined
-                cursor_update_dict[str(a)] = max(
-                    [cursor_val for _, cursor_val in parent_update_records.values()] + [a_cursor],
-                    key=lambda cursor: cursor[cursor_compare_idx],
+            if a_should_materialize:
+                should_materialize.append(a_id)
+                will_materialize[a_id] = True
+
+                newly_consumed_cursors[a_key_str] = _get_consumed_cursor(
+                    a_cursor, parent_cursors, cursor_compare_idx
                 )
 
-        if len(should_materialize) > 0:
-            context.update_cursor(json.dumps(cursor_update_dict))
+        run_requests: List[RunRequest] = []
+        if should_materialize:
+            cursor_update_dict = {
+                a_key_str: newly_consumed_cursors.get(
+                    a_key_str, cursor_dict.get(a_key_str, (0.0, 0))
+                )
+                for a_key_str in graph.asset_key_strs[: graph.num_monitored]
+            }
+            context.update_cursor(_serialize_cursor_dict(cursor_update_dict))
             context._cursor_has_been_updated = True  # pylint: disable=protected-access
-            return RunRequest(
-                run_key=f"{context.cursor}", asset_selection=list(should_materialize), tags=run_tags
-            )
+            if max_assets_per_run is None:
+                run_requests.append(
+                    RunRequest(
+                        run_key=f"{context.cursor}",
+                        asset_selection=[graph.asset_keys[a_id] for a_id in should_materialize],
+                        tags=run_tags,
+                    )
+                )
+            else:
+                for i, chunk in enumerate(
+                    _chunk_asset_ids(should_materialize, graph, max_assets_per_run)
+                ):
+                    run_requests.append(
+                        RunRequest(
+                            run_key=f"{context.cursor}:{i}",
+                            asset_selection=[graph.asset_keys[a_id] for a_id in chunk],
+                            tags=run_tags,
+                        )
+                    )
+
+        return run_requests
 
     return MultiAssetSensorDefinition(
         asset_selection=selection,
@@ -319,6 +661,7 @@ def build_asset_reconciliation_sensor(
     description: Optional[str] = None,
     default_status: DefaultSensorStatus = DefaultSensorStatus.STOPPED,
     run_tags: Optional[Mapping[str, str]] = None,
+    max_assets_per_run: Optional[int] = None,
 ) -> MultiAssetSensorDefinition:
     """Constructs a sensor that will monitor the parents of the provided assets and materialize an asset
     based on the materialization of its parents. This will keep the monitored assets up to date with the
@@ -342,6 +685,10 @@ def build_asset_reconciliation_sensor(
         default_status (DefaultSensorStatus): Whether the sensor starts as running or not. The default
             status can be overridden from Dagit or via the GraphQL API.
         run_tags (Optional[Mapping[str, str]): Dictionary of tags to pass to the RunRequests launched by this sensor
+        max_assets_per_run (Optional[int]): If set, the assets to materialize on a tick are split
+            across multiple runs of at most this many assets. Assets that depend on each other are
+            always materialized in the same run, so a run may exceed this size if a connected group
+            of assets does. By default all assets are materialized in a single run.
 
     Returns:
         A MultiAssetSensorDefinition that will monitor the parents of the provided assets to determine when
@@ -423,6 +770,12 @@ def build_asset_reconciliation_sensor(
     """
     check_valid_name(name)
     check.opt_dict_param(run_tags, "run_tags", key_type=str, value_type=str)
+    check.opt_int_param(max_assets_per_run, "max_assets_per_run")
+    check.param_invariant(
+        max_assets_per_run is None or max_assets_per_run > 0,
+        "max_assets_per_run",
+        "must be positive",
+    )
     return _make_sensor(
         selection=asset_selection,
         name=name,
@@ -432,4 +785,5 @@ def build_asset_reconciliation_sensor(
         description=description,
         default_status=default_status,
         run_tags=run_tags,
+        max_assets_per_run=max_assets_per_run,
     )
@@ -98,17 +98,22 @@ def __repr__(self):
         return "AssetKey({})".format(self.path)
 
     def __hash__(self):
-        return hash(tuple(self.path))
+        # asset keys are hashed on every lookup into the asset-keyed dicts used throughout
+        # asset evaluation, so cache the hash of the path on the instance
+        try:
+            return self.__dict__["_hash"]
+        except KeyError:
+            self.__dict__["_hash"] = hash(tuple(self.path))
+            return self.__dict__["_hash"]
 
     def __eq__(self, other):
         if not isinstance(other, AssetKey):
             return False
-        if len(self.path) != len(other.path):
-            return False
-        for i in range(0, len(self.path)):
-            if self.path[i] != other.path[i]:
-                return False
-        return True
+        return self.path == other.path
+
+    def __reduce__(self):
+        # string hashes are salted per process, so the cached hash must not be pickled
+        return (AssetKey, (self.path,))
 
     def to_string(self, legacy: Optional[bool] = False) -> Optional[str]:
         """
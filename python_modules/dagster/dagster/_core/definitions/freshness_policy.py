@@ -1,15 +1,77 @@
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Mapping, Optional
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple, cast
 
-import pendulum
 from croniter import croniter
 
+import dagster._check as check
 from dagster._annotations import experimental
 
 from .events import AssetKey
 
 
+_SECONDS_PER_DAY = 24 * 60 * 60
+
+_CRON_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+}
+
+
+def _get_fixed_cron_period_seconds(cron_schedule: str) -> Optional[int]:
+    """If the cron schedule ticks at a fixed period which evenly divides a day (e.g. `*/15 * * * *`,
+    `0 */6 * * *`, `@daily`), returns that period in seconds. Otherwise, returns None.
+    """
+    fields = _CRON_ALIASES.get(cron_schedule.strip(), cron_schedule).split()
+    if len(fields) != 5 or fields[2:] != ["*", "*", "*"]:
+        return None
+
+    def _step(field: str, num_values: int) -> Optional[int]:
+        # the step of a `*` or `*/N` field, if it evenly divides the range of that field
+        if field == "*":
+            return 1
+        if field.startswith("*/") and field[2:].isdigit():
+            step = int(field[2:])
+            if 0 < step <= num_values and num_values % step == 0:
+                return step
+        return None
+
+    minute_field, hour_field = fields[0], fields[1]
+    if minute_field != "0":
+        # ticks every N minutes
+        minute_step = _step(minute_field, 60) if hour_field == "*" else None
+        return minute_step * 60 if minute_step else None
+    if hour_field == "0":
+        return _SECONDS_PER_DAY
+    # ticks every N hours, on the hour
+    hour_step = _step(hour_field, 24)
+    return hour_step * 60 * 60 if hour_step else None
+
+
+def _resolve_ambiguous_tick(tick: datetime, bound_timestamp: float) -> datetime:
+    """When clocks fall back, croniter returns ticks in the repeated hour as wall clock times with
+    fold=0, i.e. as the earlier of the two instants with that wall clock time. Returns the latest of
+    those instants which is not after the bound, so that the tick's timestamp is correct.
+    """
+    if tick.fold:
+        return tick
+    later_tick = tick.replace(fold=1)
+    later_timestamp = later_tick.timestamp()
+    if later_timestamp != tick.timestamp() and later_timestamp <= bound_timestamp:
+        return later_tick
+    return tick
+
+
+def _datetime_from_timestamp(timestamp: float, tz) -> datetime:
+    # not every tzinfo (e.g. pendulum's) sets fold when converting from a timestamp in the repeated
+    # hour when clocks fall back, so make sure that the datetime refers to the same instant
+    dt = datetime.fromtimestamp(timestamp, tz=tz)
+    if dt.timestamp() != timestamp:
+        dt = dt.replace(fold=1 - dt.fold)
+    return dt
+
+
 @experimental
 class FreshnessPolicy(ABC):
     """A FreshnessPolicy is a policy that defines how up-to-date a given asset is expected to be.
@@ -28,6 +90,42 @@ def minutes_late(
     ) -> Optional[float]:
         raise NotImplementedError()
 
+    @staticmethod
+    def minutes_late_batch(
+        policies: Sequence["FreshnessPolicy"],
+        evaluation_time: datetime,
+        upstream_materialization_times: Sequence[Mapping[AssetKey, Optional[datetime]]],
+    ) -> Sequence[Optional[float]]:
+        """Evaluates minutes_late for each of the given policies at the same evaluation time, with
+        upstream_materialization_times[i] being the upstream materialization times for policies[i].
+
+        Work that only depends on the policy and the evaluation time is shared between policies,
+        so cron policies with the same schedule and minimum freshness only find their latest
+        required schedule tick once.
+        """
+        check.invariant(
+            len(policies) == len(upstream_materialization_times),
+            "Must provide upstream materialization times for each policy",
+        )
+        latest_required_ticks: Dict[Tuple[str, float], datetime] = {}
+        minutes_late = []
+        for policy, policy_upstream_materialization_times in zip(
+            policies, upstream_materialization_times
+        ):
+            if isinstance(policy, CronMinimumFreshnessPolicy):
+                minutes_late.append(
+                    policy._minutes_late(  # pylint: disable=protected-access
+                        evaluation_time,
+                        policy_upstream_materialization_times,
+                        latest_required_ticks,
+                    )
+                )
+            else:
+                minutes_late.append(
+                    policy.minutes_late(evaluation_time, policy_upstream_materialization_times)
+                )
+        return minutes_late
+
     @staticmethod
     def minimum_freshness(minimum_freshness_minutes: float) -> "MinimumFreshnessPolicy":
         """Static constructor for a freshness policy which specifies that the upstream data that
@@ -59,6 +157,7 @@ class MinimumFreshnessPolicy(FreshnessPolicy):
 
     def __init__(self, minimum_freshness_minutes: float):
         self._minimum_freshness_minutes = minimum_freshness_minutes
+        self._minimum_freshness_seconds = minimum_freshness_minutes * 60
 
     @property
     def minimum_freshness_minutes(self) -> float:
@@ -69,19 +168,27 @@ def minutes_late(
         evaluation_time: datetime,
         upstream_materialization_times: Mapping[AssetKey, Optional[datetime]],
     ) -> Optional[float]:
-        minimum_time = evaluation_time - pendulum.duration(minutes=self.minimum_freshness_minutes)
+        upstream_times = upstream_materialization_times.values()
+        # if any upstream materialization data is missing, then exit early
+        if None in upstream_times:
+            return None
+        if not upstream_times:
+            return 0.0
 
-        minutes_late = 0.0
-        for upstream_time in upstream_materialization_times.values():
-            # if any upstream materialization data is missing, then exit early
-            if upstream_time is None:
-                return None
+        # the asset is as late as its oldest upstream data, so find that first (with the builtin min
+        # rather than a python loop) and only convert it to minutes once
+        earliest_upstream_time = min(cast(Iterable[datetime], upstream_times))
 
-            if upstream_time < minimum_time:
-                minutes_late = max(
-                    minutes_late, (minimum_time - upstream_time).total_seconds() / 60
-                )
-        return minutes_late
+        # the evaluation times are usually pendulum datetimes, whose arithmetic is much slower
+        # than working with their timestamps
+        seconds_late = (
+            evaluation_time.timestamp()
+            - self._minimum_freshness_seconds
+            - earliest_upstream_time.timestamp()
+        )
+        if seconds_late <= 0:
+            return 0.0
+        return seconds_late / 60
 
 
 @experimental
@@ -94,6 +201,9 @@ class CronMinimumFreshnessPolicy(FreshnessPolicy):
     def __init__(self, minimum_freshness_minutes: float, cron_schedule: str):
         self._minimum_freshness_minutes = minimum_freshness_minutes
         self._cron_schedule = cron_schedule
+        self._minimum_freshness_seconds = minimum_freshness_minutes * 60
+        self._minimum_freshness_duration = timedelta(minutes=minimum_freshness_minutes)
+        self._cron_period_seconds = _get_fixed_cron_period_seconds(cron_schedule)
 
     @property
     def minimum_freshness_minutes(self) -> float:
@@ -108,30 +218,93 @@ def minutes_late(
         evaluation_time: datetime,
         upstream_materialization_times: Mapping[AssetKey, Optional[datetime]],
     ) -> Optional[float]:
-        minimum_freshness_duration = pendulum.duration(minutes=self.minimum_freshness_minutes)
+        return self._minutes_late(
+            evaluation_time, upstream_materialization_times, latest_required_ticks={}
+        )
 
+    def _get_latest_required_tick(self, evaluation_time: datetime) -> datetime:
         # find the most recent schedule tick which is more than minimum_freshness_duration old,
-        # i.e. the most recent schedule tick which could be failing this constraint
-        schedule_ticks = croniter(
-            self.cron_schedule, evaluation_time, ret_type=datetime, is_prev=True
+        # i.e. the most recent schedule tick which could be failing this constraint. Rather than
+        # stepping back from evaluation_time one tick at a time, start the search from the latest
+        # time such a tick could be at
+        if self._cron_period_seconds:
+            latest_required_tick = self._get_latest_fixed_period_tick(
+                evaluation_time, self._cron_period_seconds
+            )
+            if latest_required_tick:
+                return latest_required_tick
+
+        latest_required_tick_bound = evaluation_time - self._minimum_freshness_duration
+        bound_timestamp = latest_required_tick_bound.timestamp()
+        schedule_ticks = croniter(self.cron_schedule, latest_required_tick_bound, ret_type=datetime)
+        latest_required_tick = _resolve_ambiguous_tick(
+            schedule_ticks.get_prev(datetime), bound_timestamp
         )
-        latest_required_tick = next(schedule_ticks)
-        while latest_required_tick + minimum_freshness_duration > evaluation_time:
-            latest_required_tick = next(schedule_ticks)
-
-        minutes_late = 0.0
-        for upstream_materialization_time in upstream_materialization_times.values():
-
-            # if any upstream materialization data is missing, then exit early
-            if upstream_materialization_time is None:
-                return None
-
-            if upstream_materialization_time < latest_required_tick:
-                # find the difference between the actual data time and the latest time that you would
-                # have expected to get this data by
-                expected_by_time = latest_required_tick + minimum_freshness_duration
-                minutes_late = max(
-                    minutes_late, (evaluation_time - expected_by_time).total_seconds() / 60
-                )
+        # get_prev skips the start time itself, so check if the bound falls exactly on a tick
+        next_tick = _resolve_ambiguous_tick(schedule_ticks.get_next(datetime), bound_timestamp)
+        if (
+            next_tick.timestamp() == bound_timestamp
+            and bound_timestamp < evaluation_time.timestamp()
+        ):
+            latest_required_tick = next_tick
+        return latest_required_tick
 
-        return minutes_late
+    def _get_latest_fixed_period_tick(
+        self, evaluation_time: datetime, period_seconds: int
+    ) -> Optional[datetime]:
+        """For schedules which tick at a fixed period, finds the latest required tick with
+        arithmetic on timestamps rather than croniter. Returns None if the local time isn't aligned
+        with the period (e.g. a UTC offset of +05:30 for an hourly schedule) or the UTC offset
+        changes between the tick and the evaluation time, in which case croniter should be used
+        instead.
+        """
+        utc_offset = evaluation_time.utcoffset()
+        if utc_offset is None or utc_offset.total_seconds() % period_seconds:
+            return None
+
+        # schedule ticks are multiples of the period in local time, and since the UTC offset is a
+        # multiple of the period too, they are also multiples of the period since the epoch
+        evaluation_timestamp = evaluation_time.timestamp()
+        bound_timestamp = evaluation_timestamp - self._minimum_freshness_seconds
+        tick_timestamp = bound_timestamp - bound_timestamp % period_seconds
+        if tick_timestamp >= evaluation_timestamp:
+            tick_timestamp -= period_seconds
+
+        latest_required_tick = _datetime_from_timestamp(tick_timestamp, evaluation_time.tzinfo)
+        if latest_required_tick.utcoffset() != utc_offset:
+            return None
+        return latest_required_tick
+
+    def _minutes_late(
+        self,
+        evaluation_time: datetime,
+        upstream_materialization_times: Mapping[AssetKey, Optional[datetime]],
+        latest_required_ticks: Dict[Tuple[str, float], datetime],
+    ) -> Optional[float]:
+        """Computes minutes_late, looking up the latest required tick in latest_required_ticks
+        so that it can be shared with other policies evaluated at the same evaluation_time.
+        """
+        upstream_times = upstream_materialization_times.values()
+        # if any upstream materialization data is missing, then exit early
+        if None in upstream_times:
+            return None
+        if not upstream_times:
+            return 0.0
+
+        tick_key = (self.cron_schedule, self.minimum_freshness_minutes)
+        if tick_key not in latest_required_ticks:
+            latest_required_ticks[tick_key] = self._get_latest_required_tick(evaluation_time)
+        latest_required_tick = latest_required_ticks[tick_key]
+
+        # compare against the tick's timestamp rather than the tick, since datetimes in the same
+        # timezone are compared by their wall clock time, which is ambiguous when clocks fall back
+        latest_required_tick_timestamp = latest_required_tick.timestamp()
+        earliest_upstream_time = min(cast(Iterable[datetime], upstream_times))
+        if earliest_upstream_time.timestamp() >= latest_required_tick_timestamp:
+            return 0.0
+
+        # find the difference between the actual data time and the latest time that you would
+        # have expected to get this data by. This is the same for every upstream that is late, and
+        # is computed from timestamps since pendulum datetime arithmetic is comparatively slow
+        expected_by_timestamp = latest_required_tick_timestamp + self._minimum_freshness_seconds
+        return max(0.0, (evaluation_time.timestamp() - expected_by_timestamp) / 60)
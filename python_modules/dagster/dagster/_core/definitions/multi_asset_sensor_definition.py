@@ -895,7 +895,7 @@ def get_asset_cursor_with_advances(
             ):
                 latest_unconsumed_record_by_partition.pop(latest_consumed_partition_in_tick)
 
-            if len(latest_unconsumed_record_by_partition.keys()) >= MAX_NUM_UNCONSUMED_EVENTS:
+            if len(latest_unconsumed_record_by_partition) >= MAX_NUM_UNCONSUMED_EVENTS:
                 raise DagsterInvariantViolationError(
                     f"""
                     You have reached the maximum number of trailing unconsumed events
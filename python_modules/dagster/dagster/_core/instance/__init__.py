@@ -7,6 +7,7 @@
 import weakref
 from collections import defaultdict
 from contextlib import ExitStack
+from datetime import datetime
 from enum import Enum
 from tempfile import TemporaryDirectory
 from typing import (
@@ -1422,6 +1423,12 @@ def get_latest_materialization_events(
     def get_latest_materialization_event(self, asset_key: AssetKey) -> Optional["EventLogEntry"]:
         return self._event_storage.get_latest_materialization_events([asset_key]).get(asset_key)
 
+    @traced
+    def get_latest_materialization_timestamps(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Optional[datetime]]:
+        return self._event_storage.get_latest_materialization_timestamps(asset_keys)
+
     @public
     @traced
     def get_event_records(
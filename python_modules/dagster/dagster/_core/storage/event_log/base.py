@@ -1,5 +1,6 @@
 import base64
 from abc import ABC, abstractmethod
+from datetime import datetime
 from enum import Enum
 from typing import Callable, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Set, Union
 
@@ -17,6 +18,7 @@
 from dagster._core.instance import MayHaveInstanceWeakref
 from dagster._core.storage.pipeline_run import PipelineRunStatsSnapshot
 from dagster._seven import json
+from dagster._utils import utc_datetime_from_timestamp
 
 
 class EventLogConnection(NamedTuple):
@@ -292,6 +294,22 @@ def get_latest_materialization_events(
     ) -> Mapping[AssetKey, Optional[EventLogEntry]]:
         pass
 
+    def get_latest_materialization_timestamps(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Optional[datetime]]:
+        # base implementation of get_latest_materialization_timestamps, fetching the latest
+        # materialization of all of the assets at once rather than querying per asset. The result
+        # is in the form expected by FreshnessPolicy.minutes_late
+        asset_keys = list(check.sequence_param(asset_keys, "asset_keys", of_type=AssetKey))
+        latest_materialization_events = self.get_latest_materialization_events(asset_keys)
+        latest_materialization_timestamps = {}
+        for asset_key in asset_keys:
+            event = latest_materialization_events.get(asset_key)
+            latest_materialization_timestamps[asset_key] = (
+                utc_datetime_from_timestamp(event.timestamp) if event else None
+            )
+        return latest_materialization_timestamps
+
     @abstractmethod
     def get_asset_run_ids(self, asset_key: AssetKey) -> Iterable[str]:
         pass
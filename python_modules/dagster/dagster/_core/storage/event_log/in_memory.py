@@ -1,18 +1,30 @@
 import logging
-from collections import defaultdict
+import sqlite3
+import threading
 from contextlib import contextmanager
-from typing import Callable
+from datetime import datetime
+from typing import Callable, Dict, Mapping, Optional, Sequence, Set, Tuple
 
 from sqlalchemy.pool import NullPool
 
+import dagster._check as check
+from dagster._core.definitions.events import AssetKey
+from dagster._core.events import ASSET_EVENTS
+from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.sql import create_engine, get_alembic_config, stamp_alembic_rev
 from dagster._core.storage.sqlite import create_in_memory_conn_string
 from dagster._serdes import ConfigurableClass
+from dagster._utils import utc_datetime_from_timestamp
 
-from .schema import SqlEventLogStorageMetadata
+from .schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
 from .sql_event_log import SqlEventLogStorage
 
+# a database with the event log schema created and its alembic revision stamped, which new in-memory
+# storages are copied from so that the DDL and alembic stamp are only run once per process
+_TEMPLATE_DB_LOCK = threading.Lock()
+_template_db: Optional[sqlite3.Connection] = None
+
 
 class InMemoryEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """
@@ -24,27 +36,47 @@ class InMemoryEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     def __init__(self, inst_data=None, preload=None):
         self._inst_data = inst_data
         self._conn = self._create_connection()
-        self._handlers = defaultdict(set)
+        self._handlers: Dict[str, Set[Callable]] = {}
         self._storage_id = 0  # mirror the storage id, to mimic watching cursors
+        # the compiled event log insert used for batches, see _get_raw_insert_event
+        self._raw_insert_event: Optional[
+            Tuple[str, Sequence[Tuple[str, Optional[Callable]]]]
+        ] = None
+        # the timestamp of the latest materialization of each asset, kept up to date as events are
+        # stored so that get_latest_materialization_timestamps doesn't need to query
+        self._latest_materialization_timestamps: Dict[AssetKey, float] = {}
 
         self.reindex_events()
         self.reindex_assets()
 
         if preload:
-            for payload in preload:
-                for event in payload.event_list:
-                    self.store_event(event)
+            self.store_event_batch([event for payload in preload for event in payload.event_list])
 
     def _create_connection(self):
         engine = create_engine(create_in_memory_conn_string("event_log"), poolclass=NullPool)
         conn = engine.connect()
-        conn.execute("PRAGMA journal_mode=WAL;")
-        conn.execute("PRAGMA foreign_keys=ON;")
-        SqlEventLogStorageMetadata.create_all(conn)
-        alembic_config = get_alembic_config(__file__, "sqlite/alembic/alembic.ini")
-        stamp_alembic_rev(alembic_config, conn)
+        # WAL journaling is not available for in-memory databases, so the only pragma to set is
+        # foreign key enforcement, which is issued directly on the DBAPI connection
+        conn.connection.connection.execute("PRAGMA foreign_keys=ON;")
+        self._initialize_schema(conn)
         return conn
 
+    def _initialize_schema(self, conn):
+        global _template_db  # pylint: disable=global-statement
+
+        raw_conn = conn.connection.connection
+        with _TEMPLATE_DB_LOCK:
+            if _template_db is None:
+                SqlEventLogStorageMetadata.create_all(conn)
+                alembic_config = get_alembic_config(__file__, "sqlite/alembic/alembic.ini")
+                stamp_alembic_rev(alembic_config, conn)
+                template_db = sqlite3.connect(":memory:", check_same_thread=False)
+                raw_conn.backup(template_db)
+                _template_db = template_db
+            else:
+                # copying the pages of the template is much cheaper than re-running the DDL
+                _template_db.backup(raw_conn)
+
     @contextmanager
     def run_connection(self, run_id=None):
         yield self._conn
@@ -70,21 +102,147 @@ def upgrade(self):
 
     def store_event(self, event):
         super(InMemoryEventLogStorage, self).store_event(event)
+        self._on_event_stored(event)
+
+    def store_event_batch(self, events: Sequence[EventLogEntry]):
+        """Store many events, inserting all of their event log rows with a single statement
+        rather than one statement per event.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store, in order.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
+            return
+
+        # insert the rows on the DBAPI connection, skipping SQLAlchemy's per-statement compilation
+        # and result handling
+        insert_sql, insert_params = self._get_raw_insert_event()
+        rows = []
+        for event in events:
+            values = self._get_insert_event_values(event)
+            rows.append(
+                tuple(
+                    process(values[key]) if process else values[key]
+                    for key, process in insert_params
+                )
+            )
+        raw_conn = self._conn.connection.connection
+        raw_conn.executemany(insert_sql, rows)
+        raw_conn.commit()
+
+        for event in events:
+            if (
+                event.is_dagster_event
+                and event.dagster_event_type in ASSET_EVENTS
+                and event.dagster_event.asset_key
+            ):
+                self.store_asset_event(event)
+
+        # watches are only registered after construction, so when preloading (or whenever nothing
+        # is watching) skip looking up handlers for every event
+        notify_handlers = bool(self._handlers)
+        for event in events:
+            self._on_event_stored(event, notify_handlers=notify_handlers)
+
+    def _get_raw_insert_event(self) -> Tuple[str, Sequence[Tuple[str, Optional[Callable]]]]:
+        """Compiles the event log insert statement once, returning its SQL along with the name and
+        the SQLAlchemy bind processor of each of its positional parameters, so that values are
+        converted the same way as when the statement is executed through SQLAlchemy.
+        """
+        if self._raw_insert_event is None:
+            dialect = self._conn.dialect
+            insert_statement = (
+                SqlEventLogStorageTable.insert()  # pylint: disable=no-value-for-parameter
+            )
+            compiled = insert_statement.compile(
+                dialect=dialect,
+                column_keys=[
+                    column.name
+                    for column in SqlEventLogStorageTable.columns
+                    if not column.primary_key
+                ],
+            )
+            self._raw_insert_event = (
+                str(compiled),
+                [
+                    (
+                        key,
+                        SqlEventLogStorageTable.c[key]
+                        .type.dialect_impl(dialect)
+                        .bind_processor(dialect),
+                    )
+                    for key in compiled.positiontup
+                ],
+            )
+        return self._raw_insert_event
+
+    def _on_event_stored(self, event, notify_handlers=True):
         self._storage_id += 1
 
-        handlers = list(self._handlers[event.run_id])
-        for handler in handlers:
+        if (
+            event.is_dagster_event
+            and event.dagster_event.is_step_materialization
+            and event.dagster_event.asset_key
+        ):
+            self._latest_materialization_timestamps[event.dagster_event.asset_key] = event.timestamp
+
+        if not notify_handlers:
+            return
+
+        handlers = self._handlers.get(event.run_id)
+        if not handlers:
+            return
+
+        # the cursor is only built once there is a handler to pass it to, and shared by all of them
+        cursor = str(EventLogCursor.from_storage_id(self._storage_id))
+        # snapshot the handlers, since a handler may end its own watch
+        for handler in tuple(handlers):
             try:
-                handler(event, str(EventLogCursor.from_storage_id(self._storage_id)))
+                handler(event, cursor)
             except Exception:
                 logging.exception("Exception in callback for event watch on run %s.", event.run_id)
 
     def watch(self, run_id: str, cursor: str, callback: Callable):
-        self._handlers[run_id].add(callback)
+        self._handlers.setdefault(run_id, set()).add(callback)
 
     def end_watch(self, run_id: str, handler: Callable):
-        if handler in self._handlers[run_id]:
-            self._handlers[run_id].remove(handler)
+        handlers = self._handlers.get(run_id)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del self._handlers[run_id]
+
+    def get_latest_materialization_timestamps(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Optional[datetime]]:
+        check.sequence_param(asset_keys, "asset_keys", of_type=AssetKey)
+        latest_materialization_timestamps = {}
+        for asset_key in asset_keys:
+            timestamp = self._latest_materialization_timestamps.get(asset_key)
+            latest_materialization_timestamps[asset_key] = (
+                utc_datetime_from_timestamp(timestamp) if timestamp is not None else None
+            )
+        return latest_materialization_timestamps
+
+    def wipe(self):
+        super(InMemoryEventLogStorage, self).wipe()
+        self._latest_materialization_timestamps.clear()
+
+    def wipe_asset(self, asset_key):
+        super(InMemoryEventLogStorage, self).wipe_asset(asset_key)
+        self._latest_materialization_timestamps.pop(asset_key, None)
+
+    def delete_events(self, run_id):
+        super(InMemoryEventLogStorage, self).delete_events(run_id)
+        # deleting a run's events may or may not remove the latest materializations of its assets
+        # from the asset index, so rebuild the timestamps from it
+        asset_keys = list(self.all_asset_keys())
+        self._latest_materialization_timestamps = {
+            asset_key: event.timestamp
+            for asset_key, event in self.get_latest_materialization_events(asset_keys).items()
+            if event
+        }
 
     @property
     def is_persistent(self) -> bool:
@@ -78,7 +78,15 @@ def prepare_insert_event(self, event):
         the `dagster-postgres` implementation which overrides the generic SQL implementation of
         `store_event`.
         """
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+            **self._get_insert_event_values(event)
+        )
 
+    def _get_insert_event_values(self, event) -> Dict[str, Any]:
+        """The column values of the event log row for the event, shared by the single event insert
+        statement and batched inserts of many events.
+        """
         dagster_event_type = None
         asset_key_str = None
         partition = None
@@ -93,8 +101,7 @@ def prepare_insert_event(self, event):
             if event.dagster_event.partition:
                 partition = event.dagster_event.partition
 
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+        return dict(
             run_id=event.run_id,
             event=serialize_dagster_namedtuple(event),
             dagster_event_type=dagster_event_type,
@@ -0,0 +1,79 @@
+import json
+
+from dagster import AssetKey
+from dagster._core.definitions.asset_reconciliation_sensor import (
+    _chunk_asset_ids,
+    _deserialize_cursor_dict,
+    _get_consumed_cursor,
+    _intern_asset_graph,
+    _serialize_cursor_dict,
+    _toposort_assets,
+)
+
+
+def test_cursor_serialization_roundtrip():
+    cursor_dict = {
+        str(AssetKey("a")): (1.5, 3),
+        str(AssetKey(["prefix", "b"])): (0.0, 0),
+    }
+    assert _deserialize_cursor_dict(_serialize_cursor_dict(cursor_dict)) == cursor_dict
+    assert _deserialize_cursor_dict(None) == {}
+
+
+def test_cursor_serialization_is_json_object():
+    # the multi asset sensor context unpacks the cursor as a JSON object keyed by asset key str
+    cursor_dict = {str(AssetKey("a")): (1.5, 3)}
+    assert json.loads(_serialize_cursor_dict(cursor_dict)) == {str(AssetKey("a")): [1.5, 3]}
+
+
+def test_intern_asset_graph():
+    a, b, c, source = AssetKey("a"), AssetKey("b"), AssetKey("c"), AssetKey("source")
+    upstream = {c: {a, b}, b: {a, source}, a: set()}
+
+    toposort_assets = _toposort_assets(upstream)
+    assert toposort_assets == [a, b, c]
+
+    graph = _intern_asset_graph(upstream, toposort_assets)
+    assert graph.num_monitored == 3
+    # monitored assets are numbered in topological order, followed by unmonitored parents
+    assert graph.asset_keys == [a, b, c, source]
+    assert graph.asset_key_strs == [str(key) for key in graph.asset_keys]
+    assert [set(graph.get_parent_ids(asset_id)) for asset_id in range(3)] == [
+        set(),
+        {0, 3},
+        {0, 1},
+    ]
+    assert list(graph.parent_indptr) == [0, 0, 2, 4]
+    assert graph.parent_asset_keys == {a, b, source}
+
+
+def test_get_consumed_cursor():
+    parent_cursors = [(5.0, 2), (3.0, 7), (0.0, 0)]
+    # compare storage ids
+    assert _get_consumed_cursor((1.0, 1), parent_cursors, 1) == (3.0, 7)
+    assert _get_consumed_cursor((1.0, 9), parent_cursors, 1) == (1.0, 9)
+    # compare timestamps, as for run sharded storages
+    assert _get_consumed_cursor((1.0, 1), parent_cursors, 0) == (5.0, 2)
+    # with no parent cursors, keep the existing cursor
+    assert _get_consumed_cursor((1.0, 1), [], 1) == (1.0, 1)
+
+
+def test_chunk_asset_ids():
+    a, b, c, d, e = (AssetKey(name) for name in "abcde")
+    # a -> b -> c is one connected group, d and e are independent
+    upstream = {a: set(), b: {a}, c: {b}, d: set(), e: set()}
+    graph = _intern_asset_graph(upstream, _toposort_assets(upstream))
+    asset_ids = list(range(graph.num_monitored))
+
+    def _chunk_keys(max_assets_per_run):
+        return [
+            {graph.asset_keys[a_id] for a_id in chunk}
+            for chunk in _chunk_asset_ids(asset_ids, graph, max_assets_per_run)
+        ]
+
+    assert _chunk_keys(5) == [{a, b, c, d, e}]
+    # connected assets are never split across runs, even if that exceeds the max
+    chunks = _chunk_keys(1)
+    assert len(chunks) == 3
+    assert {a, b, c} in chunks and {d} in chunks and {e} in chunks
+    assert sorted(len(chunk) for chunk in _chunk_keys(4)) == [1, 4]
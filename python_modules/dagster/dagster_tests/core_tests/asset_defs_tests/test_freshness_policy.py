@@ -1,7 +1,10 @@
 import pytest
 
 from dagster import AssetKey
-from dagster._core.definitions.freshness_policy import FreshnessPolicy
+from dagster._core.definitions.freshness_policy import (
+    FreshnessPolicy,
+    _get_fixed_cron_period_seconds,
+)
 from dagster._seven.compat.pendulum import create_pendulum_time
 
 
@@ -80,6 +83,52 @@
             # we evaluate at 7:45, so at this point it is 45 minutes late
             45,
         ),
+        # evaluated exactly when the data for 2AM is due, so it is not late yet
+        (
+            FreshnessPolicy.cron_minimum_freshness(
+                cron_schedule="@hourly", minimum_freshness_minutes=60 * 5
+            ),
+            create_pendulum_time(2022, 1, 1, 0, 30),
+            create_pendulum_time(2022, 1, 1, 7, 0),
+            0,
+        ),
+        # the minimum freshness is measured in elapsed time, even across a DST transition. the
+        # data for 22:00 the day before is due 24 hours later, at 23:00 local time
+        (
+            FreshnessPolicy.cron_minimum_freshness(
+                cron_schedule="*/15 * * * *", minimum_freshness_minutes=60 * 24
+            ),
+            create_pendulum_time(2022, 3, 12, 21, 0, tz="America/Los_Angeles"),
+            create_pendulum_time(2022, 3, 13, 23, 0, tz="America/Los_Angeles"),
+            0,
+        ),
+        # evaluated during the repeated hour when clocks fall back, at 01:40 PST. the latest
+        # required tick is 01:00 PST rather than 01:00 PDT, so the data is due by 01:30 PST
+        (
+            FreshnessPolicy.cron_minimum_freshness(
+                cron_schedule="@hourly", minimum_freshness_minutes=30
+            ),
+            create_pendulum_time(2022, 11, 5, 0, 0, tz="America/Los_Angeles"),
+            create_pendulum_time(2022, 11, 6, 9, 40, tz="UTC").in_tz("America/Los_Angeles"),
+            10,
+        ),
+        (
+            FreshnessPolicy.cron_minimum_freshness(
+                cron_schedule="*/15 * * * *", minimum_freshness_minutes=0
+            ),
+            create_pendulum_time(2022, 11, 5, 0, 0, tz="America/Los_Angeles"),
+            create_pendulum_time(2022, 11, 6, 9, 24, tz="UTC").in_tz("America/Los_Angeles"),
+            9,
+        ),
+        # evaluated during the first 01:xx hour (PDT) when clocks fall back
+        (
+            FreshnessPolicy.cron_minimum_freshness(
+                cron_schedule="@hourly", minimum_freshness_minutes=30
+            ),
+            create_pendulum_time(2022, 11, 5, 0, 0, tz="America/Los_Angeles"),
+            create_pendulum_time(2022, 11, 6, 8, 40, tz="UTC").in_tz("America/Los_Angeles"),
+            10,
+        ),
     ],
 )
 def test_policies(policy, materialization_time, evaluation_time, expected_minutes_late):
@@ -93,3 +142,115 @@ def test_policies(policy, materialization_time, evaluation_time, expected_minute
     )
 
     assert minutes_late == expected_minutes_late
+
+
+def test_minutes_late_batch():
+    evaluation_time = create_pendulum_time(2022, 1, 2, 2, 0)
+    policies = [
+        FreshnessPolicy.minimum_freshness(30),
+        FreshnessPolicy.cron_minimum_freshness(
+            cron_schedule="@daily", minimum_freshness_minutes=15
+        ),
+        FreshnessPolicy.cron_minimum_freshness(
+            cron_schedule="@daily", minimum_freshness_minutes=15
+        ),
+        FreshnessPolicy.cron_minimum_freshness(
+            cron_schedule="@hourly", minimum_freshness_minutes=15
+        ),
+    ]
+    upstream_materialization_times = [
+        {AssetKey("a"): create_pendulum_time(2022, 1, 2, 1, 0)},
+        {AssetKey("a"): create_pendulum_time(2022, 1, 1, 23, 0)},
+        {AssetKey("a"): None},
+        {AssetKey("a"): create_pendulum_time(2022, 1, 2, 1, 30)},
+    ]
+
+    assert FreshnessPolicy.minutes_late_batch(
+        policies, evaluation_time, upstream_materialization_times
+    ) == [30, 60 + 45, None, 0]
+
+
+def test_minimum_freshness_multiple_upstreams():
+    policy = FreshnessPolicy.minimum_freshness(30)
+    evaluation_time = create_pendulum_time(2022, 1, 1, 1, 0)
+    upstream_materialization_times = {
+        AssetKey("a"): create_pendulum_time(2022, 1, 1, 0, 50),
+        # the oldest upstream data determines how late the asset is
+        AssetKey("b"): create_pendulum_time(2022, 1, 1, 0, 0),
+        AssetKey("c"): create_pendulum_time(2022, 1, 1, 0, 20),
+    }
+    assert policy.minutes_late(evaluation_time, upstream_materialization_times) == 30
+    assert policy.minutes_late(evaluation_time, {}) == 0
+    assert (
+        policy.minutes_late(
+            evaluation_time, {**upstream_materialization_times, AssetKey("d"): None}
+        )
+        is None
+    )
+
+
+def test_cron_minimum_freshness_multiple_upstreams():
+    policy = FreshnessPolicy.cron_minimum_freshness(
+        cron_schedule="@daily", minimum_freshness_minutes=15
+    )
+    evaluation_time = create_pendulum_time(2022, 1, 2, 2, 0)
+    upstream_materialization_times = {
+        AssetKey("a"): create_pendulum_time(2022, 1, 2, 1, 0),
+        AssetKey("b"): create_pendulum_time(2022, 1, 1, 23, 0),
+    }
+    # any upstream predating the required tick makes the asset late by the same amount
+    assert policy.minutes_late(evaluation_time, upstream_materialization_times) == 60 + 45
+    assert (
+        policy.minutes_late(
+            evaluation_time,
+            {**upstream_materialization_times, AssetKey("c"): create_pendulum_time(2022, 1, 1)},
+        )
+        == 60 + 45
+    )
+    assert policy.minutes_late(evaluation_time, {AssetKey("a"): evaluation_time}) == 0
+
+
+@pytest.mark.parametrize(
+    ["cron_schedule", "expected_period_seconds"],
+    [
+        ("* * * * *", 60),
+        ("*/15 * * * *", 15 * 60),
+        ("@hourly", 60 * 60),
+        ("0 */6 * * *", 6 * 60 * 60),
+        ("@daily", 24 * 60 * 60),
+        # not a fixed period
+        ("*/7 * * * *", None),
+        ("5 * * * *", None),
+        ("0 */5 * * *", None),
+        ("0 0 */2 * *", None),
+        ("0 9 * * 1-5", None),
+    ],
+)
+def test_fixed_cron_period_seconds(cron_schedule, expected_period_seconds):
+    assert _get_fixed_cron_period_seconds(cron_schedule) == expected_period_seconds
+
+
+@pytest.mark.parametrize("tz", ["UTC", "US/Central", "Asia/Kolkata"])
+def test_cron_policies_in_timezone(tz):
+    # fixed period schedules don't need croniter to find their ticks unless the local time is not
+    # aligned with the period, so check that both give the same results
+    hourly_policy = FreshnessPolicy.cron_minimum_freshness(
+        cron_schedule="@hourly", minimum_freshness_minutes=60 * 5
+    )
+    daily_policy = FreshnessPolicy.cron_minimum_freshness(
+        cron_schedule="@daily", minimum_freshness_minutes=15
+    )
+    assert (
+        hourly_policy.minutes_late(
+            create_pendulum_time(2022, 1, 2, 2, 45, tz=tz),
+            {AssetKey("root"): create_pendulum_time(2022, 1, 1, 20, 15, tz=tz)},
+        )
+        == 45
+    )
+    assert (
+        daily_policy.minutes_late(
+            create_pendulum_time(2022, 1, 2, 2, 0, tz=tz),
+            {AssetKey("root"): create_pendulum_time(2022, 1, 1, 23, 0, tz=tz)},
+        )
+        == 60 + 45
+    )
@@ -1,3 +1,5 @@
+import pickle
+
 from dagster import AssetKey, AssetMaterialization, Output, job, op
 from dagster._core.definitions.events import parse_asset_key_string
 from dagster._core.events.log import EventLogEntry
@@ -17,6 +19,18 @@ def test_structured_asset_key():
     assert asset_structured.path[0] == "(Hello)"
 
 
+def test_asset_key_hash():
+    asset_key = AssetKey(["prefix", "name"])
+    assert hash(asset_key) == hash(AssetKey(["prefix", "name"]))
+    assert {asset_key: 1}[AssetKey(["prefix", "name"])] == 1
+    assert asset_key != AssetKey(["prefix"])
+
+    unpickled = pickle.loads(pickle.dumps(asset_key))
+    assert unpickled == asset_key
+    assert hash(unpickled) == hash(asset_key)
+    assert "_hash" not in pickle.dumps(asset_key).decode("latin-1")
+
+
 def test_parse_asset_key_string():
     assert parse_asset_key_string("foo.bar_b-az") == ["foo", "bar_b", "az"]
 
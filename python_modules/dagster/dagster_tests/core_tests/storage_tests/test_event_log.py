@@ -7,6 +7,7 @@
 import pytest
 import sqlalchemy
 
+from dagster import AssetKey, AssetMaterialization, Output
 from dagster._core.errors import DagsterEventLogInvalidForRun
 from dagster._core.storage.event_log import (
     ConsolidatedSqliteEventLogStorage,
@@ -15,9 +16,17 @@
     SqlEventLogStorageTable,
     SqliteEventLogStorage,
 )
+from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.sql import create_engine
-
-from .utils.event_log_storage import TestEventLogStorage
+from dagster._core.test_utils import instance_for_test
+from dagster._core.utils import make_new_run_id
+from dagster._legacy import solid
+
+from .utils.event_log_storage import (
+    TestEventLogStorage,
+    _synthesize_events,
+    create_test_event_log_record,
+)
 
 
 class TestInMemoryEventLogStorage(TestEventLogStorage):
@@ -31,6 +40,49 @@ def event_log_storage(self):  # pylint: disable=arguments-differ
         finally:
             storage.dispose()
 
+    def test_storages_are_independent(self, storage, test_run_id):
+        storage.store_event(create_test_event_log_record("message", test_run_id))
+        assert len(storage.get_logs_for_run(test_run_id)) == 1
+
+        # new storages are copied from a template database, and don't share any events
+        other_storage = InMemoryEventLogStorage()
+        try:
+            assert len(other_storage.get_logs_for_run(test_run_id)) == 0
+            other_storage.store_event(create_test_event_log_record("other message", test_run_id))
+            assert len(other_storage.get_logs_for_run(test_run_id)) == 1
+            assert len(storage.get_logs_for_run(test_run_id)) == 1
+        finally:
+            other_storage.dispose()
+
+    def test_store_event_batch(self, storage):
+        asset_key = AssetKey("asset_one")
+        run_id = make_new_run_id()
+
+        @solid
+        def materialize_one(_):
+            yield AssetMaterialization(asset_key=asset_key)
+            yield Output(1)
+
+        def _solids():
+            materialize_one()
+
+        with instance_for_test() as created_instance:
+            events, _ = _synthesize_events(_solids, instance=created_instance, run_id=run_id)
+
+        watched_cursors = []
+        storage.watch(run_id, None, lambda _event, cursor: watched_cursors.append(cursor))
+        storage.store_event_batch(events)
+
+        assert [log.user_message for log in storage.get_logs_for_run(run_id)] == [
+            event.user_message for event in events
+        ]
+        assert asset_key in set(storage.all_asset_keys())
+        # each event is still reported to watchers with its own storage id
+        assert watched_cursors == [
+            str(EventLogCursor.from_storage_id(storage_id))
+            for storage_id in range(1, len(events) + 1)
+        ]
+
 
 class TestSqliteEventLogStorage(TestEventLogStorage):
     __test__ = True
@@ -69,7 +69,7 @@
 )
 from dagster._loggers import colored_console_logger
 from dagster._serdes import deserialize_json_to_dagster_namedtuple
-from dagster._utils import datetime_as_float
+from dagster._utils import datetime_as_float, utc_datetime_from_timestamp
 
 TEST_TIMEOUT = 5
 
@@ -950,6 +950,51 @@ def _solids():
             assert isinstance(record, EventLogRecord)
             assert record.event_log_entry.dagster_event.asset_key == asset_key
 
+    def test_get_latest_materialization_timestamps(self, storage, test_run_id):
+        asset_key = AssetKey(["path", "to", "asset_one"])
+        missing_asset_key = AssetKey(["path", "to", "missing"])
+
+        @solid
+        def materialize_one(_):
+            yield AssetMaterialization(asset_key=asset_key)
+            yield Output(1)
+
+        def _solids():
+            materialize_one()
+
+        with instance_for_test() as created_instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(created_instance)
+
+            events, _ = _synthesize_events(_solids, instance=created_instance, run_id=test_run_id)
+            for event in events:
+                storage.store_event(event)
+
+            records = storage.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                    asset_key=asset_key,
+                )
+            )
+            assert len(records) == 1
+            record = records[0]
+
+            latest_materialization_timestamps = storage.get_latest_materialization_timestamps(
+                [asset_key, missing_asset_key]
+            )
+            assert latest_materialization_timestamps == {
+                asset_key: utc_datetime_from_timestamp(record.event_log_entry.timestamp),
+                missing_asset_key: None,
+            }
+            # any sequence of asset keys is accepted, not just lists
+            assert (
+                storage.get_latest_materialization_timestamps((asset_key, missing_asset_key))
+                == latest_materialization_timestamps
+            )
+
+            storage.wipe_asset(asset_key)
+            assert storage.get_latest_materialization_timestamps([asset_key]) == {asset_key: None}
+
     def test_asset_events_error_parsing(self, storage):
         if not isinstance(storage, SqlEventLogStorage):
             pytest.skip("This test is for SQL-backed Event Log behavior")
@@ -4,8 +4,10 @@
 import pendulum
 import pytest
 
-from dagster import AssetKey, materialize
+from dagster import AssetKey, AssetSelection, build_asset_reconciliation_sensor, materialize
+from dagster._check import CheckError
 from dagster._core.scheduler.instigation import TickStatus
+from dagster._core.storage.tags import RUN_KEY_TAG
 from dagster._seven.compat.pendulum import create_pendulum_time, to_timezone
 
 from .test_run_status_sensors import (
@@ -18,6 +20,7 @@
     e,
     evaluate_sensors,
     f,
+    g,
     get_sensor_executors,
     h,
     sleeper,
@@ -1134,3 +1137,72 @@ def test_with_tags(executor):
             assert run_request.pipeline_name == "__ASSET_JOB"
             assert run_request.asset_selection == {AssetKey("y")}
             assert run_request.tags.get("hello") == "world"
+
+
+@pytest.mark.parametrize("executor", get_sensor_executors())
+def test_max_assets_per_run_sensor(executor):
+    """Asset graph:
+        x       z       e
+        | \     / \     /
+        |   d       f
+        |    \     /
+        y       g
+    Sensor for d, f, g, and y that materializes at most one asset per run when any of their
+    parents have materialized
+    Tests that materializing x, z, and e results in one run for the connected assets d, f, and g
+    and a separate run for y, with a single cursor update for the tick
+    """
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, tz="UTC"),
+        "US/Central",
+    )
+    with instance_with_sensors(attribute="asset_sensor_repo") as (
+        instance,
+        workspace_ctx,
+        external_repo,
+    ):
+        with pendulum.test(freeze_datetime):
+            the_sensor = external_repo.get_external_sensor("d_f_g_and_y_OR_one_asset_per_run")
+            instance.start_sensor(the_sensor)
+
+            materialize([x, z, e], instance=instance)
+            wait_for_all_runs_to_finish(instance)
+
+            evaluate_sensors(workspace_ctx, executor)
+
+            ticks = instance.get_ticks(the_sensor.get_external_origin_id(), the_sensor.selector_id)
+            assert len(ticks) == 1
+            validate_tick(
+                ticks[0],
+                the_sensor,
+                freeze_datetime,
+                TickStatus.SUCCESS,
+            )
+
+            wait_for_all_runs_to_finish(instance)
+            # the most recent two runs are the ones launched by the sensor
+            runs = instance.get_runs(limit=2)
+            assert len(runs) == 2
+            assert set(ticks[0].tick_data.run_ids) == {run.run_id for run in runs}
+            # connected assets are materialized together even though that exceeds the max
+            assert {frozenset(run.asset_selection) for run in runs} == {
+                frozenset([AssetKey("d"), AssetKey("f"), AssetKey("g")]),
+                frozenset([AssetKey("y")]),
+            }
+
+            # both runs are keyed off the same cursor, which the tick only wrote once
+            state = instance.get_instigator_state(
+                the_sensor.get_external_origin_id(), the_sensor.selector_id
+            )
+            cursor = state.instigator_data.cursor
+            assert ticks[0].cursor == cursor
+            assert sorted(run.tags[RUN_KEY_TAG] for run in runs) == [f"{cursor}:0", f"{cursor}:1"]
+
+
+def test_max_assets_per_run_must_be_positive():
+    with pytest.raises(CheckError, match="max_assets_per_run"):
+        build_asset_reconciliation_sensor(
+            asset_selection=AssetSelection.assets(g),
+            name="zero_assets_per_run",
+            max_assets_per_run=0,
+        )
@@ -754,6 +754,13 @@ def asset_sensor_repo():
             wait_for_all_upstream=True,
             wait_for_in_progress_runs=False,
         ),
+        build_asset_reconciliation_sensor(
+            asset_selection=AssetSelection.assets(d, f, g, y),
+            name="d_f_g_and_y_OR_one_asset_per_run",
+            wait_for_all_upstream=False,
+            wait_for_in_progress_runs=False,
+            max_assets_per_run=1,
+        ),
         build_asset_reconciliation_sensor(
             asset_selection=AssetSelection.assets(waits_on_sleep),
             name="in_progress_condition_sensor",
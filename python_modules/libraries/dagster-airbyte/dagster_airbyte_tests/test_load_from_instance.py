@@ -16,43 +16,64 @@
 )
 
 
+AIRBYTE_CONFIG = {
+    "host": "some_host",
+    "port": "8000",
+}
+
+
+# the sample instance responses are the same for every parametrization, so only build them once
+@pytest.fixture(name="ab_resource", scope="module")
+def ab_resource_fixture():
+    return airbyte_resource(build_init_resource_context(config=AIRBYTE_CONFIG))
+
+
+@pytest.fixture(name="instance_workspaces_json", scope="module")
+def instance_workspaces_json_fixture():
+    return get_instance_workspaces_json()
+
+
+@pytest.fixture(name="instance_connections_json", scope="module")
+def instance_connections_json_fixture():
+    return get_instance_connections_json()
+
+
+@pytest.fixture(name="instance_operations_json", scope="module")
+def instance_operations_json_fixture():
+    return get_instance_operations_json()
+
+
 @responses.activate
 @pytest.mark.parametrize("use_normalization_tables", [True, False])
 @pytest.mark.parametrize("connection_to_group_fn", [None, lambda x: f"{x[0]}_group"])
 @pytest.mark.parametrize("filter_connection", [True, False])
-def test_load_from_instance(use_normalization_tables, connection_to_group_fn, filter_connection):
-
-    ab_resource = airbyte_resource(
-        build_init_resource_context(
-            config={
-                "host": "some_host",
-                "port": "8000",
-            }
-        )
-    )
-    ab_instance = airbyte_resource.configured(
-        {
-            "host": "some_host",
-            "port": "8000",
-        }
-    )
+def test_load_from_instance(
+    use_normalization_tables,
+    connection_to_group_fn,
+    filter_connection,
+    ab_resource,
+    instance_workspaces_json,
+    instance_connections_json,
+    instance_operations_json,
+):
+    ab_instance = airbyte_resource.configured(AIRBYTE_CONFIG)
 
     responses.add(
         method=responses.POST,
         url=ab_resource.api_base_url + "/workspaces/list",
-        json=get_instance_workspaces_json(),
+        json=instance_workspaces_json,
         status=200,
     )
     responses.add(
         method=responses.POST,
         url=ab_resource.api_base_url + "/connections/list",
-        json=get_instance_connections_json(),
+        json=instance_connections_json,
         status=200,
     )
     responses.add(
         method=responses.POST,
         url=ab_resource.api_base_url + "/operations/list",
-        json=get_instance_operations_json(),
+        json=instance_operations_json,
         status=200,
     )
     if connection_to_group_fn:
@@ -119,17 +140,13 @@ def test_load_from_instance(use_normalization_tables, connection_to_group_fn, fi
         )
 
     assert ab_assets[0].keys == {AssetKey(t) for t in tables}
-    assert all(
-        [
-            ab_assets[0].group_names_by_key.get(AssetKey(t))
-            == (
-                connection_to_group_fn("GitHub <> snowflake-ben")
-                if connection_to_group_fn
-                else "github_snowflake_ben"
-            )
-            for t in tables
-        ]
+    expected_group = (
+        connection_to_group_fn("GitHub <> snowflake-ben")
+        if connection_to_group_fn
+        else "github_snowflake_ben"
     )
+    group_names_by_key = ab_assets[0].group_names_by_key
+    assert all(group_names_by_key.get(AssetKey(t)) == expected_group for t in tables)
     assert len(ab_assets[0].op.output_defs) == len(tables)
 
     responses.add(